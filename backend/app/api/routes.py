@@ -1,146 +1,366 @@
 """FastAPI routes exposing the PyBoy emulator backend."""
 from __future__ import annotations
 
-from functools import lru_cache
+import asyncio
 from pathlib import Path
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+import httpx
+import orjson
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Query,
+    Response,
+    WebSocket,
+    WebSocketDisconnect,
+)
+from fastapi.responses import JSONResponse
 
-from ..core.config import Settings, get_settings
+from ..core.config import get_settings
 from ..emulator import EmulatorManager, build_emulator_config
+from ..emulator.models import compress_frame_packet, zstd_available
 from ..emulator.session import EmulatorSession
 from ..models.emulator_api import (
-    GameStatePayload,
-    HealthResponse,
-    ListSessionsResponse,
     LoadStateRequest,
-    LoadStateResponse,
     ResetRequest,
-    ResetResponse,
-    SaveStateResponse,
     StartEmulationRequest,
-    StartEmulationResponse,
-    StateResponse,
     StepRequest,
-    StepResponse,
 )
+from ..models.messages import ConversationRequest, ConversationResponse
+from ..models.messages import StepRequest as AIStepRequest
+from ..services.gemma import build_action_prompt, get_gemma_client
 
 router = APIRouter()
 
 
-@lru_cache()
-def _build_manager(settings: Settings) -> EmulatorManager:
-    config = build_emulator_config(settings)
-    return EmulatorManager(config)
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson, bypassing ``jsonable_encoder``."""
+
+    media_type = "application/json"
+
+    def render(self, content: object) -> bytes:
+        return orjson.dumps(content, default=str, option=orjson.OPT_SERIALIZE_NUMPY)
+
+
+# Single manager shared by the whole process. Memoizing here instead of with
+# lru_cache avoids hashing the (unhashable) Settings instance per request and
+# guarantees the PyBoy manager is built exactly once.
+_manager: Optional[EmulatorManager] = None
+
+
+async def get_manager() -> EmulatorManager:
+    # async so FastAPI resolves the dependency inline instead of dispatching
+    # this trivial lookup through the anyio threadpool on every request.
+    global _manager
+    if _manager is None:
+        _manager = EmulatorManager(build_emulator_config(get_settings()))
+    return _manager
 
 
-def get_manager(settings: Settings = Depends(get_settings)) -> EmulatorManager:
-    return _build_manager(settings)
+def shutdown_manager() -> None:
+    """Close all sessions and drop the shared manager (app shutdown hook)."""
 
+    global _manager, _global_health_bytes
+    if _manager is not None:
+        _manager.shutdown()
+        _manager = None
+    _global_health_bytes = None
 
-@router.post("/start", response_model=StartEmulationResponse)
+
+# Responses that are stable for the lifetime of the process, serialized once
+# and returned as raw bytes afterwards.
+_games_bytes: Optional[bytes] = None
+_global_health_bytes: Optional[bytes] = None
+
+
+@router.post("/start")
 def start_emulation(
     payload: StartEmulationRequest,
     manager: EmulatorManager = Depends(get_manager),
-) -> StartEmulationResponse:
+) -> ORJSONResponse:
     session = manager.start_session(payload.rom_path)
-    state_payload = _to_state_payload(session.current_state())
-    response = StartEmulationResponse(
-        session_id=session.session_id,
-        state=state_payload,
-        action_labels=list(session.action_labels),
-        config=session.config.to_dict(),
+    return ORJSONResponse(
+        {
+            "session_id": session.session_id,
+            "state": session.current_state().to_payload(),
+            "action_labels": list(session.action_labels),
+            "config": session.config.to_dict(),
+        }
     )
-    return response
 
 
-@router.post("/step", response_model=StepResponse)
-def step_emulation(
+@router.post("/step")
+async def step_emulation(
     payload: StepRequest,
     manager: EmulatorManager = Depends(get_manager),
-) -> StepResponse:
+) -> ORJSONResponse:
     session = _get_session(manager, payload.session_id)
     try:
-        result = session.step(payload.action)
+        result = await asyncio.get_running_loop().run_in_executor(
+            session.executor, session.step, payload.action
+        )
     except ValueError as error:
         raise HTTPException(status_code=400, detail=str(error)) from error
-    response = StepResponse(session_id=session.session_id, **result.to_payload())
-    return response
+    return ORJSONResponse({"session_id": session.session_id, **result.to_payload()})
 
 
-@router.get("/state", response_model=StateResponse)
-def get_state(
+@router.get("/state")
+async def get_state(
     session_id: str = Query(..., description="Identifier of the emulator session."),
     manager: EmulatorManager = Depends(get_manager),
-) -> StateResponse:
+) -> ORJSONResponse:
     session = _get_session(manager, session_id)
-    state_payload = _to_state_payload(session.current_state())
-    return StateResponse(session_id=session.session_id, state=state_payload)
+    # capture_state reads the PyBoy screen and copies into the frame pool, so
+    # it must run on the session's thread like every other engine call.
+    state = await asyncio.get_running_loop().run_in_executor(
+        session.executor, session.current_state
+    )
+    return ORJSONResponse(
+        {"session_id": session.session_id, "state": state.to_payload()}
+    )
 
 
-@router.post("/reset", response_model=ResetResponse)
-def reset_session(
+@router.post("/reset")
+async def reset_session(
     payload: ResetRequest,
     manager: EmulatorManager = Depends(get_manager),
-) -> ResetResponse:
+) -> ORJSONResponse:
     session = _get_session(manager, payload.session_id)
-    state = session.reset()
-    return ResetResponse(session_id=session.session_id, state=_to_state_payload(state))
+    state = await asyncio.get_running_loop().run_in_executor(
+        session.executor, session.reset
+    )
+    return ORJSONResponse(
+        {"session_id": session.session_id, "state": state.to_payload()}
+    )
 
 
-@router.get("/health", response_model=HealthResponse)
-def get_health(
+@router.get("/health")
+async def get_health(
     session_id: Optional[str] = Query(
         None,
         description="When provided returns health metrics for a specific session."
         " Otherwise returns global configuration data.",
     ),
     manager: EmulatorManager = Depends(get_manager),
-) -> HealthResponse:
+) -> Response:
     if session_id:
         session = _get_session(manager, session_id)
-        return HealthResponse(
-            session_id=session.session_id,
-            health=session.current_health(),
-            config=session.config.to_dict(),
+        return ORJSONResponse(
+            {
+                "session_id": session.session_id,
+                "health": session.current_health(),
+                "config": session.config.to_dict(),
+            }
         )
-    return HealthResponse(
-        session_id=None,
-        health={"status": "ok"},
-        config=manager.config.to_dict(),
-    )
+    global _global_health_bytes
+    if _global_health_bytes is None:
+        _global_health_bytes = orjson.dumps(
+            {
+                "session_id": None,
+                "health": {"status": "ok"},
+                "config": manager.config.to_dict(),
+            }
+        )
+    return Response(_global_health_bytes, media_type="application/json")
 
 
-@router.post("/save", response_model=SaveStateResponse)
-def save_state(
+@router.post("/save")
+async def save_state(
     payload: ResetRequest,
     manager: EmulatorManager = Depends(get_manager),
-) -> SaveStateResponse:
+) -> ORJSONResponse:
     session = _get_session(manager, payload.session_id)
-    path = session.save_state()
-    return SaveStateResponse(session_id=session.session_id, path=str(path))
+    # State blobs are multi-MB; run the blocking work off the event loop, on
+    # the session's executor so all engine access stays on its one thread.
+    path = await asyncio.get_running_loop().run_in_executor(
+        session.executor, session.save_state
+    )
+    return ORJSONResponse({"session_id": session.session_id, "path": str(path)})
 
 
-@router.post("/load", response_model=LoadStateResponse)
-def load_state(
+@router.post("/load")
+async def load_state(
     payload: LoadStateRequest,
     manager: EmulatorManager = Depends(get_manager),
-) -> LoadStateResponse:
+) -> ORJSONResponse:
     session = _get_session(manager, payload.session_id)
     rom_path = Path(payload.path)
     if not rom_path.exists():
         raise HTTPException(status_code=404, detail=f"El archivo {rom_path} no existe.")
-    state = session.load_state(rom_path)
-    return LoadStateResponse(
-        session_id=session.session_id,
-        state=_to_state_payload(state),
+    state = await asyncio.get_running_loop().run_in_executor(
+        session.executor, session.load_state, rom_path
     )
+    return ORJSONResponse(
+        {"session_id": session.session_id, "state": state.to_payload()}
+    )
+
 
+@router.get("/games")
+async def list_games() -> Response:
+    """List the ROM identifiers discovered in the configured ROMs directory."""
 
-@router.get("/sessions", response_model=ListSessionsResponse)
-def list_sessions(manager: EmulatorManager = Depends(get_manager)) -> ListSessionsResponse:
-    return ListSessionsResponse(sessions=[session.session_id for session in manager.list_sessions()])
+    global _games_bytes
+    if _games_bytes is None:
+        # get_settings() is lru_cached; calling it here beats a Depends hop
+        # that FastAPI would resolve on every request.
+        _games_bytes = orjson.dumps({"games": get_settings().available_games})
+    return Response(_games_bytes, media_type="application/json")
+
+
+@router.get("/sessions")
+async def list_sessions(manager: EmulatorManager = Depends(get_manager)) -> ORJSONResponse:
+    return ORJSONResponse(
+        {"sessions": [session.session_id for session in manager.list_sessions()]}
+    )
+
+
+@router.websocket("/ws/stream/{session_id}")
+async def stream_frames(
+    websocket: WebSocket,
+    session_id: str,
+    compression: Optional[str] = Query(
+        None, description="Set to 'zstd' to receive zstd-compressed frame packets."
+    ),
+) -> None:
+    """Stream frames as raw binary packets; REST stays the control plane.
+
+    The client sends one action label per message and receives the resulting
+    frame as ``FrameEnvelope.to_bytes`` output, skipping base64 and JSON on
+    the per-frame path. With ``?compression=zstd`` each packet (header
+    included) is additionally zstd-compressed; requesting it when the codec
+    is unavailable silently falls back to raw packets.
+    """
+
+    use_zstd = compression == "zstd" and zstd_available()
+    manager = await get_manager()
+    try:
+        session = manager.get_session(session_id)
+    except KeyError:
+        await websocket.close(code=1008)
+        return
+    await websocket.accept()
+    loop = asyncio.get_running_loop()
+    try:
+        while True:
+            action = await websocket.receive_text()
+            try:
+                result = await loop.run_in_executor(
+                    session.executor, session.step, action
+                )
+            except ValueError as error:
+                await websocket.send_json({"error": str(error)})
+                continue
+            state = result.new_state
+            packet = state.frame.to_bytes(state.step_count)
+            if use_zstd:
+                packet = compress_frame_packet(packet)
+            await websocket.send_bytes(packet)
+    except WebSocketDisconnect:
+        return
+
+
+@router.websocket("/ws/chat/{session_id}")
+async def stream_chat(websocket: WebSocket, session_id: str) -> None:
+    """Stream Gemma chat replies as binary UTF-8 chunks.
+
+    The client sends a ``ConversationRequest`` payload per message and
+    receives the reply incrementally via ``send_bytes`` — no buffering of
+    the full generation and no re-encoding on the way out. A final
+    ``{"done": true}`` JSON frame marks the end of each reply.
+    """
+
+    manager = await get_manager()
+    try:
+        manager.get_session(session_id)
+    except KeyError:
+        await websocket.close(code=1008)
+        return
+    await websocket.accept()
+    try:
+        while True:
+            payload = ConversationRequest(**await websocket.receive_json())
+            try:
+                async for chunk in get_gemma_client().stream_chat_reply_bytes(
+                    payload.messages
+                ):
+                    await websocket.send_bytes(chunk)
+            except httpx.HTTPError as error:
+                await websocket.send_json(
+                    {"error": f"No se pudo contactar a Ollama: {error}"}
+                )
+                continue
+            await websocket.send_json({"done": True})
+    except WebSocketDisconnect:
+        return
+
+
+@router.post("/sessions/{session_id}/chat", response_model=ConversationResponse)
+async def chat_with_ai(
+    session_id: str,
+    payload: ConversationRequest,
+    manager: EmulatorManager = Depends(get_manager),
+) -> ConversationResponse:
+    _get_session(manager, session_id)
+    try:
+        reply = await get_gemma_client().generate_chat_reply(payload.messages)
+    except httpx.HTTPError as error:
+        raise HTTPException(
+            status_code=502, detail=f"No se pudo contactar a Ollama: {error}"
+        ) from error
+    return ConversationResponse(reply=reply)
+
+
+@router.post("/sessions/{session_id}/ai-step")
+async def ai_step(
+    session_id: str,
+    payload: AIStepRequest,
+    manager: EmulatorManager = Depends(get_manager),
+) -> ORJSONResponse:
+    session = _get_session(manager, session_id)
+    action_label = payload.player_action or "NOOP"
+    observation: Optional[str] = None
+    if payload.use_ai:
+        # The observation summary and prompt are only built when Gemma is
+        # actually consulted; plain player-driven steps skip all of it. One
+        # capture on the session's thread yields both the summary and the
+        # frame digest, so the memoization key always describes the same
+        # frame as the prompt.
+        observation, frame_digest = await asyncio.get_running_loop().run_in_executor(
+            session.executor, session.observe
+        )
+        prompt = build_action_prompt(
+            observation, session.action_labels_csv, payload.player_action
+        )
+        # The prompt embeds a timestamp, so memoization keys on the frame
+        # content (plus the player's suggestion) instead of the prompt text.
+        cache_key = frame_digest + (payload.player_action or "").encode()
+        try:
+            suggestion = await get_gemma_client().generate_action(
+                prompt, cache_key=cache_key
+            )
+        except httpx.HTTPError as error:
+            raise HTTPException(
+                status_code=502, detail=f"No se pudo contactar a Ollama: {error}"
+            ) from error
+        if session.has_action(suggestion):
+            action_label = suggestion
+    try:
+        result = await asyncio.get_running_loop().run_in_executor(
+            session.executor, session.step, action_label
+        )
+    except ValueError as error:
+        raise HTTPException(status_code=400, detail=str(error)) from error
+    return ORJSONResponse(
+        {
+            "observation": observation,
+            "action_taken": action_label,
+            "reward": result.reward,
+            "done": result.terminated or result.truncated,
+            "info": dict(result.info),
+        }
+    )
 
 
 def _get_session(manager: EmulatorManager, session_id: str) -> EmulatorSession:
@@ -148,7 +368,3 @@ def _get_session(manager: EmulatorManager, session_id: str) -> EmulatorSession:
         return manager.get_session(session_id)
     except KeyError as error:
         raise HTTPException(status_code=404, detail=str(error)) from error
-
-
-def _to_state_payload(state) -> GameStatePayload:
-    return GameStatePayload.parse_obj(state.to_payload())
@@ -1,7 +1,8 @@
 """Application configuration settings for the IAboy backend."""
 from __future__ import annotations
 
-from functools import lru_cache
+import os
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
@@ -23,6 +24,14 @@ class Settings(BaseSettings):
         "gemma2:9b",
         description="Name of the Gemma 2 model served by Ollama.",
     )
+    ollama_parallel: int = Field(
+        4,
+        ge=1,
+        description=(
+            "Maximum number of concurrent requests sent to Ollama. Should match "
+            "the OLLAMA_NUM_PARALLEL setting of the server."
+        ),
+    )
     roms_path: Path = Field(
         Path("roms"),
         description="Directory where game ROM files are stored.",
@@ -78,34 +87,44 @@ class Settings(BaseSettings):
         (".gb", ".gbc"),
         description="Accepted ROM file extensions for the PyBoy emulator backend.",
     )
-    available_games: List[str] = Field(
-        default_factory=list,
-        description=(
-            "Backwards-compatible list of detected ROM identifiers. The PyBoy backend "
-            "does not enforce this whitelist and accepts any valid Game Boy ROM file."
-        ),
-    )
-
     class Config:
         env_file = "../.env"
         case_sensitive = False
+        keep_untouched = (cached_property,)
 
-    @validator("roms_path", "save_states_path", pre=True)
+    @validator("roms_path", "save_states_path", pre=True, allow_reuse=True)
     def _expand_path(cls, value: Path | str) -> Path:  # noqa: D401
         """Ensure configured paths are absolute and exist."""
 
-        path = Path(value).expanduser().resolve()
-        path.mkdir(parents=True, exist_ok=True)
+        # Validators can fire more than once during nested model creation, so
+        # skip the expanduser/realpath and mkdir syscalls when the path is
+        # already in its final form.
+        path = Path(value)
+        if not path.is_absolute():
+            path = path.expanduser().resolve()
+        if not path.is_dir():
+            path.mkdir(parents=True, exist_ok=True)
         return path
 
-    @validator("available_games", always=True)
-    def _load_available_games(cls, v: list[str], values: dict) -> list[str]:
-        """Scan the configured ROMs path to discover available games."""
+    @cached_property
+    def available_games(self) -> List[str]:
+        """Detected ROM identifiers, scanned lazily on first access.
+
+        The scan used to run inside an ``always=True`` validator, walking the
+        filesystem on every ``Settings()`` instantiation. The PyBoy backend
+        does not enforce this whitelist and accepts any valid Game Boy ROM
+        file.
+        """
 
-        roms_path = values.get("roms_path")
-        if roms_path and roms_path.is_dir():
-            return sorted([p.stem for p in roms_path.glob("*") if p.is_file()])
-        return v
+        if not self.roms_path.is_dir():
+            return []
+        # os.scandir reuses the stat data from the directory read, avoiding a
+        # Path allocation and an extra stat() syscall per entry. splitext
+        # keeps Path.stem semantics (dotfiles keep their name).
+        with os.scandir(self.roms_path) as entries:
+            return sorted(
+                os.path.splitext(entry.name)[0] for entry in entries if entry.is_file()
+            )
 
 
 @lru_cache()
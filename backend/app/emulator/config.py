@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Iterable, Mapping, MutableMapping, Optional, Tuple
+from typing import Dict, FrozenSet, Iterable, Mapping, MutableMapping, Optional, Tuple
 
 from ..core.config import Settings
 
@@ -16,11 +16,25 @@ class ActionDefinition:
     press_events: Tuple[str, ...] = field(default_factory=tuple)
     release_events: Tuple[str, ...] = field(default_factory=tuple)
 
-    def __post_init__(self) -> None:  # noqa: D401
-        """Validate that no empty string events are configured."""
-
-        if any(event == "" for event in (*self.press_events, *self.release_events)):
+    @classmethod
+    def validated(
+        cls,
+        label: str,
+        press_events: Iterable[str] = (),
+        release_events: Iterable[str] = (),
+    ) -> "ActionDefinition":
+        """Build a definition from untrusted input, rejecting empty events.
+
+        The compile-time defaults below are known-good, so the check only
+        runs for externally configured overrides instead of on every
+        construction.
+        """
+
+        press = tuple(press_events)
+        release = tuple(release_events)
+        if any(event == "" for event in (*press, *release)):
             raise ValueError("Action events cannot contain empty strings.")
+        return cls(label, press, release)
 
 
 DEFAULT_ACTION_MAP: Tuple[ActionDefinition, ...] = (
@@ -67,6 +81,16 @@ DEFAULT_ACTION_MAP: Tuple[ActionDefinition, ...] = (
     ),
 )
 
+DEFAULT_ACTION_LABELS: FrozenSet[str] = frozenset(
+    action.label for action in DEFAULT_ACTION_MAP
+)
+
+# Canonical label-sorted ordering of the defaults, computed once at import so
+# build_emulator_config only re-sorts when overrides actually changed the map.
+_DEFAULT_SORTED_ACTION_MAP: Tuple[ActionDefinition, ...] = tuple(
+    sorted(DEFAULT_ACTION_MAP, key=lambda action: action.label)
+)
+
 
 @dataclass
 class EmulatorConfig:
@@ -83,6 +107,32 @@ class EmulatorConfig:
     memory_watch_addresses: Mapping[str, int]
     default_rom: Optional[str]
     rom_extensions: Tuple[str, ...]
+    action_labels: Tuple[str, ...] = field(init=False, compare=False)
+    _rom_extensions_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    _dict_cache: Dict[str, object] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Labels are derived once here; every consumer (engine, sessions,
+        # serialised config) reuses this tuple instead of re-walking the
+        # action map.
+        self.action_labels = tuple(action.label for action in self.action_map)
+        self._rom_extensions_set = frozenset(ext.lower() for ext in self.rom_extensions)
+        # The config never changes after construction, so the serialisable
+        # view embedded in /start, /health and /sessions responses is built
+        # exactly once.
+        self._dict_cache = {
+            "roms_path": str(self.roms_path),
+            "save_states_path": str(self.save_states_path),
+            "frame_dimensions": self.frame_dimensions,
+            "frame_skip": self.frame_skip,
+            "autosave_interval_steps": self.autosave_interval_steps,
+            "health_check_interval_steps": self.health_check_interval_steps,
+            "max_consecutive_health_failures": self.max_consecutive_health_failures,
+            "default_rom": self.default_rom,
+            "rom_extensions": self.rom_extensions,
+            "action_labels": list(self.action_labels),
+            "memory_watch_addresses": dict(self.memory_watch_addresses),
+        }
 
     def resolve_rom_path(self, rom_reference: Optional[str]) -> Path:
         """Resolve the target ROM path ensuring the extension is supported."""
@@ -97,7 +147,7 @@ class EmulatorConfig:
         if not rom_path.is_absolute():
             rom_path = self.roms_path / rom_path
         rom_path = rom_path.expanduser().resolve()
-        if rom_path.suffix.lower() not in {ext.lower() for ext in self.rom_extensions}:
+        if rom_path.suffix.lower() not in self._rom_extensions_set:
             raise ValueError(
                 f"La ROM '{rom_path}' no tiene una extensión soportada: {self.rom_extensions}."
             )
@@ -108,25 +158,12 @@ class EmulatorConfig:
     def to_dict(self) -> Dict[str, object]:
         """Return a serialisable representation useful for debugging and health APIs."""
 
-        return {
-            "roms_path": str(self.roms_path),
-            "save_states_path": str(self.save_states_path),
-            "frame_dimensions": self.frame_dimensions,
-            "frame_skip": self.frame_skip,
-            "autosave_interval_steps": self.autosave_interval_steps,
-            "health_check_interval_steps": self.health_check_interval_steps,
-            "max_consecutive_health_failures": self.max_consecutive_health_failures,
-            "default_rom": self.default_rom,
-            "rom_extensions": self.rom_extensions,
-            "action_labels": [action.label for action in self.action_map],
-            "memory_watch_addresses": dict(self.memory_watch_addresses),
-        }
+        return self._dict_cache
 
 
 def build_emulator_config(settings: Settings) -> EmulatorConfig:
     """Create an :class:`EmulatorConfig` instance from application settings."""
 
-    action_labels = {action.label for action in DEFAULT_ACTION_MAP}
     configured_actions: MutableMapping[str, ActionDefinition] = {
         action.label: action for action in DEFAULT_ACTION_MAP
     }
@@ -134,15 +171,24 @@ def build_emulator_config(settings: Settings) -> EmulatorConfig:
     # Allow overriding action bindings from environment variables. Each entry must
     # be encoded as LABEL=EVENT1|EVENT2;EVENT3|EVENT4 where the first group defines
     # press events and the second optional group defines release events.
+    overridden = False
     for label, encoded in getattr(settings, "action_overrides", {}).items():  # type: ignore[attr-defined]
-        if label not in action_labels:
+        if label not in DEFAULT_ACTION_LABELS:
             raise ValueError(f"Acción desconocida al configurar PyBoy: {label}")
         segments = encoded.split(";")
         press_events = tuple(filter(None, segments[0].split("|"))) if segments else tuple()
         release_events: Iterable[str] = tuple()
         if len(segments) > 1:
             release_events = tuple(filter(None, segments[1].split("|")))
-        configured_actions[label] = ActionDefinition(label, press_events, tuple(release_events))
+        configured_actions[label] = ActionDefinition.validated(
+            label, press_events, release_events
+        )
+        overridden = True
+
+    if overridden:
+        action_map = tuple(configured_actions[label] for label in sorted(configured_actions))
+    else:
+        action_map = _DEFAULT_SORTED_ACTION_MAP
 
     return EmulatorConfig(
         roms_path=settings.roms_path,
@@ -152,7 +198,7 @@ def build_emulator_config(settings: Settings) -> EmulatorConfig:
         autosave_interval_steps=settings.autosave_interval_steps,
         health_check_interval_steps=settings.health_check_interval_steps,
         max_consecutive_health_failures=settings.max_consecutive_health_failures,
-        action_map=tuple(configured_actions[label] for label in sorted(configured_actions)),
+        action_map=action_map,
         memory_watch_addresses=settings.memory_watch_addresses,
         default_rom=settings.default_rom,
         rom_extensions=settings.rom_extensions,
@@ -1,8 +1,12 @@
 """Core PyBoy engine wrapper providing a deterministic, testable API."""
 from __future__ import annotations
 
+import inspect
+import io
+import mmap
+import time
 from pathlib import Path
-from typing import Callable, Iterable, Optional
+from typing import Callable, Dict, Iterable, Mapping, Optional, Tuple
 
 import numpy as np
 
@@ -19,6 +23,11 @@ class PyBoyEngine:
         pyboy_factory: Optional[Callable[[Path], object]] = None,
     ) -> None:
         self.config = config
+        # The action map is immutable for the engine's lifetime; index it once
+        # so per-step lookups are O(1) instead of a linear scan.
+        self._actions_by_label = {action.label: action for action in config.action_map}
+        self._action_labels = config.action_labels
+        self._memory_runs = _plan_memory_runs(config.memory_watch_addresses)
         self._pyboy_factory = pyboy_factory or self._default_factory
         self._pyboy: Optional[object] = None
         self._window = None
@@ -26,6 +35,21 @@ class PyBoyEngine:
         self._step_count = 0
         self._last_score = 0
         self._last_state: Optional[GameState] = None
+        self._frame_buffers: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        self._frame_slot = 0
+        self._frame_validated = False
+        self._send_input: Optional[Callable[[object], None]] = None
+        self._tick_fn: Optional[Callable[..., object]] = None
+        self._tick_accepts_count = False
+        self._screen_fn: Optional[Callable[[], np.ndarray]] = None
+        self._screen_image_fn: Optional[Callable[[], object]] = None
+        self._screen_image_channels: Optional[int] = None
+        self._get_memory_value: Optional[Callable[[int], int]] = None
+        self._memory_view: Optional[object] = None
+        self._has_paused = False
+        self._window_event_cls: Optional[type] = None
+        self._resolved_events: Dict[Tuple[str, ...], Tuple[object, ...]] = {}
+        self._info_template: Dict[str, object] = {}
 
     # ------------------------------------------------------------------
     # Lifecycle management
@@ -40,6 +64,13 @@ class PyBoyEngine:
         self._step_count = 0
         self._last_score = 0
         self._last_state = self._capture_state()
+        # The ROM and frame geometry are fixed for the lifetime of this
+        # start; seed the per-step info dict from a template instead of
+        # recomputing these entries on every step.
+        self._info_template = {
+            "rom": str(rom_path),
+            "frame_shape": list(self._last_state.frame.pixels.shape),
+        }
         return self._last_state
 
     def reset(self) -> GameState:
@@ -58,6 +89,13 @@ class PyBoyEngine:
                 close()
         self._pyboy = None
         self._window = None
+        self._send_input = None
+        self._tick_fn = None
+        self._screen_fn = None
+        self._screen_image_fn = None
+        self._screen_image_channels = None
+        self._get_memory_value = None
+        self._memory_view = None
         self._last_state = None
 
     # ------------------------------------------------------------------
@@ -73,7 +111,7 @@ class PyBoyEngine:
 
     @property
     def action_labels(self) -> tuple[str, ...]:
-        return tuple(action.label for action in self.config.action_map)
+        return self._action_labels
 
     # ------------------------------------------------------------------
     # Public API
@@ -87,8 +125,7 @@ class PyBoyEngine:
         action = self._resolve_action(action_label)
         self._dispatch_events(action.press_events)
 
-        for _ in range(self.config.frame_skip):
-            self._tick()
+        self._tick(self.config.frame_skip)
 
         if action.release_events:
             self._dispatch_events(action.release_events)
@@ -96,12 +133,9 @@ class PyBoyEngine:
         self._step_count += 1
         state = self._capture_state()
         reward = self._calculate_reward(state)
-        info = {
-            "step_count": self._step_count,
-            "rom": str(self._rom_path) if self._rom_path else None,
-            "frame_shape": list(state.frame.pixels.shape),
-            "frame_timestamp": state.frame.timestamp,
-        }
+        info = dict(self._info_template)
+        info["step_count"] = self._step_count
+        info["frame_timestamp"] = state.frame.timestamp
         result = GameStepResult(
             new_state=state,
             reward=reward,
@@ -129,13 +163,34 @@ class PyBoyEngine:
             self._pyboy.save_state(handle)  # type: ignore[attr-defined]
         return path
 
+    def serialize_state(self) -> bytes:
+        """Serialise the current emulator state into memory.
+
+        Lets callers capture the state on the emulator thread and defer the
+        disk write elsewhere, instead of blocking the emulator on I/O.
+        """
+
+        if self._pyboy is None:
+            raise RuntimeError("PyBoy has not been initialised. Call start() first.")
+        buffer = io.BytesIO()
+        self._pyboy.save_state(buffer)  # type: ignore[attr-defined]
+        return buffer.getvalue()
+
     def load_state(self, path: Path) -> GameState:
         """Load the emulator state from *path* and return the resulting snapshot."""
 
         if self._pyboy is None:
             raise RuntimeError("PyBoy has not been initialised. Call start() first.")
         with path.open("rb") as handle:
-            self._pyboy.load_state(handle)  # type: ignore[attr-defined]
+            # Map the blob instead of pulling it through buffered reads; the
+            # kernel pages it in on demand with zero copies into Python.
+            # mmap objects are file-like, which is all load_state needs.
+            size = path.stat().st_size
+            if size:
+                with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                    self._pyboy.load_state(view)  # type: ignore[attr-defined]
+            else:  # pragma: no cover - empty files cannot be mapped
+                self._pyboy.load_state(handle)  # type: ignore[attr-defined]
         # Run one tick to allow the emulator to settle on the restored state.
         self._tick()
         self._last_state = self._capture_state()
@@ -164,49 +219,112 @@ class PyBoyEngine:
         self._window = getattr(self._pyboy, "window", None)
         if self._window is None and hasattr(self._pyboy, "get_window"):
             self._window = self._pyboy.get_window()
-
-    def _tick(self) -> None:
+        self._send_input = getattr(self._window, "send_input", None)
+        # Recent PyBoy releases accept tick(count) and run the batch natively;
+        # probe the signature once so frame skipping crosses the Python/PyBoy
+        # boundary a single time per step instead of once per frame.
+        tick = getattr(self._pyboy, "tick", None)
+        self._tick_fn = tick if callable(tick) else None
+        self._tick_accepts_count = False
+        if self._tick_fn is not None:
+            try:
+                parameters = inspect.signature(self._tick_fn).parameters
+            except (TypeError, ValueError):  # pragma: no cover - C callables
+                pass
+            else:
+                self._tick_accepts_count = len(parameters) >= 1
+        # Capability probes (hasattr/getattr chains) are paid once here rather
+        # than on every captured frame.
+        self._screen_fn = None
+        self._screen_image_fn = None
+        if hasattr(self._pyboy, "botsupport_manager"):
+            manager = self._pyboy.botsupport_manager()
+            if manager and hasattr(manager, "screen"):
+                screen = manager.screen()
+                if screen is not None and hasattr(screen, "screen_ndarray"):
+                    self._screen_fn = screen.screen_ndarray
+        if self._screen_fn is None and hasattr(self._pyboy, "screen_image"):
+            self._screen_image_fn = self._pyboy.screen_image
+        self._get_memory_value = getattr(self._pyboy, "get_memory_value", None)
+        memory = getattr(self._pyboy, "memory", None)
+        self._memory_view = memory if hasattr(memory, "__getitem__") else None
+        self._has_paused = hasattr(self._pyboy, "paused")
+        # Pre-resolve every configured event name into its WindowEvent enum
+        # once per start, so the per-step dispatch path is a dict lookup plus
+        # bound-method calls instead of an import and getattr per event.
+        self._resolved_events = {}
+        try:
+            from pyboy.utils import WindowEvent
+        except ImportError:  # pragma: no cover - injected factories without pyboy
+            self._window_event_cls = None
+        else:
+            self._window_event_cls = WindowEvent
+            for action in self.config.action_map:
+                for events in (action.press_events, action.release_events):
+                    if events and events not in self._resolved_events:
+                        self._resolved_events[events] = tuple(
+                            self._resolve_window_event(name) for name in events
+                        )
+
+    def _tick(self, count: int = 1) -> None:
         if self._pyboy is None:
             raise RuntimeError("PyBoy has not been initialised. Call start() first.")
-        tick = getattr(self._pyboy, "tick", None)
-        if not callable(tick):
+        tick = self._tick_fn
+        if tick is None:
             raise RuntimeError("The PyBoy instance does not expose a tick() method.")
-        tick()
+        if self._tick_accepts_count:
+            tick(count)
+        else:
+            for _ in range(count):
+                tick()
 
     def _resolve_action(self, label: str) -> ActionDefinition:
-        for action in self.config.action_map:
-            if action.label == label:
-                return action
-        raise ValueError(f"Acción desconocida: {label}")
+        try:
+            return self._actions_by_label[label]
+        except KeyError:
+            raise ValueError(f"Acción desconocida: {label}") from None
 
-    def _dispatch_events(self, events: Iterable[str]) -> None:
+    def _dispatch_events(self, events: Tuple[str, ...]) -> None:
         if not events:
             return
-        if self._window is None:
+        send_input = self._send_input
+        if send_input is None:
             raise RuntimeError("La ventana de PyBoy no está inicializada.")
-        for event_name in events:
-            event = self._resolve_window_event(event_name)
-            self._window.send_input(event)  # type: ignore[attr-defined]
+        resolved = self._resolved_events.get(events)
+        if resolved is None:
+            resolved = tuple(self._resolve_window_event(name) for name in events)
+            self._resolved_events[events] = resolved
+        for event in resolved:
+            send_input(event)
 
     def _resolve_window_event(self, event_name: str):
-        try:
-            from pyboy.utils import WindowEvent
-        except ImportError as exc:  # pragma: no cover
-            raise RuntimeError(
-                "pyboy.utils.WindowEvent no está disponible. Verifica la instalación de PyBoy."
-            ) from exc
-        if not hasattr(WindowEvent, event_name):
+        window_event = self._window_event_cls
+        if window_event is None:
+            try:
+                from pyboy.utils import WindowEvent
+            except ImportError as exc:  # pragma: no cover
+                raise RuntimeError(
+                    "pyboy.utils.WindowEvent no está disponible. Verifica la instalación de PyBoy."
+                ) from exc
+            window_event = self._window_event_cls = WindowEvent
+        if not hasattr(window_event, event_name):
             raise ValueError(f"Evento de ventana desconocido: {event_name}")
-        return getattr(WindowEvent, event_name)
+        return getattr(window_event, event_name)
 
     def _capture_state(self) -> GameState:
         frame = self._capture_frame()
         memory_snapshot = self._capture_memory()
-        frame.validate(self.config.frame_dimensions)
+        # The frame shape cannot drift while the pooled buffers stay put, so
+        # revalidating every capture is redundant; the flag resets whenever
+        # the pool is (re)allocated and the HealthMonitor still validates on
+        # its own cadence as a backstop.
+        if not self._frame_validated:
+            frame.validate(self.config.frame_dimensions)
+            self._frame_validated = True
         state = GameState(
             frame=frame,
             is_game_over=bool(memory_snapshot.get("game_over", False)),
-            paused=bool(getattr(self._pyboy, "paused", False)),
+            paused=bool(self._pyboy.paused) if self._has_paused else False,  # type: ignore[attr-defined]
             score=memory_snapshot.get("score"),
             lives=memory_snapshot.get("lives"),
             progress=memory_snapshot.get("progress"),
@@ -218,20 +336,50 @@ class PyBoyEngine:
     def _capture_frame(self) -> FrameEnvelope:
         if self._pyboy is None:
             raise RuntimeError("PyBoy has not been initialised. Call start() first.")
-        frame_array = None
-        # Try bot-support first which returns numpy arrays directly.
-        if hasattr(self._pyboy, "botsupport_manager"):
-            manager = self._pyboy.botsupport_manager()
-            if manager and hasattr(manager, "screen"):
-                screen = manager.screen()
-                if screen is not None and hasattr(screen, "screen_ndarray"):
-                    frame_array = screen.screen_ndarray()
-        if frame_array is None and hasattr(self._pyboy, "screen_image"):
-            image = self._pyboy.screen_image()
-            frame_array = np.array(image, copy=False)
-        if frame_array is None:
+        # Bot-support is preferred because it returns numpy arrays directly;
+        # both accessors were resolved in _configure_runtime.
+        if self._screen_fn is not None:
+            frame_array = self._screen_fn()
+        elif self._screen_image_fn is not None:
+            image = self._screen_image_fn()
+            # Wrap the PIL buffer directly instead of letting np.array walk
+            # the image; the band count is probed once since the screen
+            # format never changes mid-run. The pool copy below materialises
+            # the read-only view.
+            channels = self._screen_image_channels
+            if channels is None:
+                channels = self._screen_image_channels = len(image.getbands())
+            frame_array = np.frombuffer(image.tobytes(), dtype=np.uint8).reshape(
+                image.height, image.width, channels
+            )
+        else:
             raise RuntimeError("PyBoy no pudo proporcionar un frame de video.")
-        return FrameEnvelope(pixels=frame_array)
+        if frame_array.ndim == 3 and frame_array.shape[-1] == 4:
+            # PyBoy screens are RGBA but clients only consume RGB; dropping
+            # alpha before serialisation saves 25% of the bytes per frame.
+            # The copy into the pool below materialises the strided view.
+            frame_array = frame_array[..., :3]
+        # One explicit clock read per capture; everything downstream (info,
+        # payloads, health) reuses frame.timestamp instead of re-reading it.
+        return FrameEnvelope(pixels=self._copy_into_pool(frame_array), timestamp=time.time())
+
+    def _copy_into_pool(self, source: np.ndarray) -> np.ndarray:
+        """Copy *source* into one of two preallocated frame buffers.
+
+        The screen API may hand back a view into PyBoy's internal buffer
+        that is overwritten on the next tick. Double-buffering isolates the
+        captured state from that, keeps the previous state's pixels valid
+        while the current one is produced, and avoids a fresh ~70 KB
+        allocation per frame.
+        """
+
+        if self._frame_buffers is None or self._frame_buffers[0].shape != source.shape:
+            self._frame_buffers = (np.empty_like(source), np.empty_like(source))
+            self._frame_validated = False
+        self._frame_slot ^= 1
+        buffer = self._frame_buffers[self._frame_slot]
+        np.copyto(buffer, source)
+        return buffer
 
     def _capture_memory(self) -> dict[str, int]:
         snapshot: dict[str, int] = {}
@@ -239,9 +387,24 @@ class PyBoyEngine:
             return snapshot
         if not self.config.memory_watch_addresses:
             return snapshot
+        # PyBoy 2.x exposes a sliceable memory view; reading each precomputed
+        # contiguous run in one slice crosses the API boundary once per run
+        # instead of once per watched address.
+        if self._memory_view is not None:
+            try:
+                for start, stop, names in self._memory_runs:
+                    values = self._memory_view[start:stop]  # type: ignore[index]
+                    for name, offset in names:
+                        snapshot[name] = int(values[offset])
+                return snapshot
+            except Exception:  # pragma: no cover - defensive path
+                snapshot.clear()
+        get_memory_value = self._get_memory_value
+        if get_memory_value is None:
+            return snapshot
         for name, address in self.config.memory_watch_addresses.items():
             try:
-                value = int(self._pyboy.get_memory_value(address))  # type: ignore[attr-defined]
+                value = int(get_memory_value(address))
             except Exception:  # pragma: no cover - defensive path
                 value = -1
             snapshot[name] = value
@@ -254,6 +417,27 @@ class PyBoyEngine:
         return reward
 
 
+def _plan_memory_runs(
+    watch_addresses: Mapping[str, int],
+) -> Tuple[Tuple[int, int, Tuple[Tuple[str, int], ...]], ...]:
+    """Group watched addresses into contiguous ``(start, stop, names)`` runs.
+
+    Adjacent addresses collapse into a single run so they can be fetched with
+    one slice read; ``names`` pairs each watch label with its offset inside
+    the run. Computed once at engine construction.
+    """
+
+    runs: list[list] = []
+    for name, address in sorted(watch_addresses.items(), key=lambda item: item[1]):
+        if runs and address <= runs[-1][1] + 1:
+            run = runs[-1]
+            run[1] = max(run[1], address)
+            run[2].append((name, address - run[0]))
+        else:
+            runs.append([address, address, [(name, 0)]])
+    return tuple((start, end + 1, tuple(names)) for start, end, names in runs)
+
+
 def ensure_path(path: Path) -> Path:
     """Utility ensuring that the parent directories of *path* exist."""
 
@@ -1,7 +1,9 @@
 """Session registry and orchestration helpers."""
 from __future__ import annotations
 
-from typing import Callable, Dict, Iterable, Optional
+import sys
+import threading
+from typing import Callable, Dict, Optional, Tuple
 
 from .config import EmulatorConfig
 from .engine import PyBoyEngine
@@ -34,6 +36,10 @@ class EmulatorManager:
         self._engine_factory = engine_factory or _default_engine_factory
         self._monitor_factory = monitor_factory or _default_monitor_factory
         self._sessions: Dict[str, EmulatorSession] = {}
+        # Immutable snapshot swapped atomically on every mutation so readers
+        # (status pollers, /sessions) never need the writer lock.
+        self._snapshot: Tuple[EmulatorSession, ...] = ()
+        self._registry_lock = threading.Lock()
 
     def start_session(self, rom_reference: Optional[str]) -> EmulatorSession:
         session = EmulatorSession(
@@ -42,23 +48,41 @@ class EmulatorManager:
             monitor=self._monitor_factory(self.config),
         )
         session.start(rom_reference)
-        self._sessions[session.session_id] = session
+        # Interned ids make the per-request registry lookups pointer
+        # comparisons instead of full string compares.
+        session.session_id = sys.intern(session.session_id)
+        with self._registry_lock:
+            self._sessions[session.session_id] = session
+            self._snapshot = tuple(self._sessions.values())
         return session
 
     def get_session(self, session_id: str) -> EmulatorSession:
-        if session_id not in self._sessions:
-            raise KeyError(f"Sesión '{session_id}' inexistente.")
-        return self._sessions[session_id]
+        try:
+            return self._sessions[session_id]
+        except KeyError:
+            raise KeyError(f"Sesión '{session_id}' inexistente.") from None
 
     def close_session(self, session_id: str) -> None:
-        session = self._sessions.pop(session_id, None)
+        with self._registry_lock:
+            session = self._sessions.pop(session_id, None)
+            self._snapshot = tuple(self._sessions.values())
         if session:
             session.close()
 
-    def list_sessions(self) -> Iterable[EmulatorSession]:
-        return list(self._sessions.values())
+    def list_sessions(self) -> Tuple[EmulatorSession, ...]:
+        """Point-in-time snapshot of the registered sessions.
+
+        The returned tuple stays valid while sessions are created or closed
+        on other threads. It is maintained on mutation, so reads cost
+        nothing and take no lock.
+        """
+
+        return self._snapshot
 
     def shutdown(self) -> None:
-        for session in list(self._sessions.values()):
+        with self._registry_lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+            self._snapshot = ()
+        for session in sessions:
             session.close()
-        self._sessions.clear()
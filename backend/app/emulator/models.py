@@ -2,12 +2,44 @@
 from __future__ import annotations
 
 import base64
+import struct
 import time
 from dataclasses import dataclass, field
 from typing import Dict, Iterable, Mapping, MutableMapping, Optional
 
 import numpy as np
 
+try:  # Optional: only needed for the WebSocket stream's compressed mode.
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None  # type: ignore[assignment]
+
+# Binary frame packet header used by the WebSocket stream:
+# u16 width, u16 height, u8 channels, u8 dtype code, u64 step, u64 ts (ns).
+_FRAME_HEADER = struct.Struct("<HHBBQQ")
+_DTYPE_CODES = {"uint8": 1, "uint16": 2, "float32": 3}
+
+# One shared low-level compressor; frame packets are compressed on the event
+# loop thread only, so no locking is needed, and level 1 keeps the latency
+# cost well under the bandwidth it saves on largely-static Game Boy frames.
+_ZSTD_COMPRESSOR = zstandard.ZstdCompressor(level=1) if zstandard is not None else None
+
+
+def zstd_available() -> bool:
+    """Whether compressed frame packets can be produced in this install."""
+
+    return _ZSTD_COMPRESSOR is not None
+
+
+def compress_frame_packet(packet: bytes) -> bytes:
+    """Compress a binary frame packet (header included) with zstd."""
+
+    if _ZSTD_COMPRESSOR is None:
+        raise RuntimeError(
+            "zstandard no está instalado. Instálalo con `pip install zstandard`."
+        )
+    return _ZSTD_COMPRESSOR.compress(packet)
+
 
 @dataclass
 class FrameEnvelope:
@@ -15,6 +47,10 @@ class FrameEnvelope:
 
     pixels: np.ndarray
     timestamp: float = field(default_factory=lambda: time.time())
+    _b64: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _payload: Optional[Dict[str, object]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def validate(self, expected_shape: Optional[Iterable[int]] = None) -> None:
         """Ensure the frame contains valid data before it is returned to clients."""
@@ -29,9 +65,58 @@ class FrameEnvelope:
             )
 
     def as_base64(self) -> str:
-        """Return the frame encoded as base64 so it can be sent via JSON."""
+        """Return the frame encoded as base64 so it can be sent via JSON.
+
+        The encoded string is cached lazily: a single state is serialised
+        into several payloads (step response, health payload, info), and the
+        pixels of a captured frame never change afterwards.
+        """
+
+        if self._b64 is None:
+            self._b64 = base64.b64encode(self.pixels.tobytes()).decode("ascii")
+        return self._b64
+
+    def to_bytes(self, step_count: int = 0) -> bytes:
+        """Serialise the frame as a binary packet for WebSocket streaming.
 
-        return base64.b64encode(self.pixels.tobytes()).decode("ascii")
+        Raw pixel bytes avoid the ~33% base64 overhead and the JSON parse on
+        the client; the fixed header carries the metadata the JSON payload
+        would otherwise duplicate.
+        """
+
+        pixels = np.ascontiguousarray(self.pixels)
+        if pixels.ndim == 2:
+            height, width = pixels.shape
+            channels = 1
+        else:
+            height, width, channels = pixels.shape
+        header = _FRAME_HEADER.pack(
+            width,
+            height,
+            channels,
+            _DTYPE_CODES.get(str(pixels.dtype), 0),
+            step_count,
+            int(self.timestamp * 1e9),
+        )
+        return header + pixels.tobytes()
+
+    def to_payload(self) -> Dict[str, object]:
+        """JSON-serialisable view of the frame, built once per capture.
+
+        A single state is embedded in several payloads (step response, state
+        response, health info); caching saves re-deriving the shape list,
+        dtype string and base64 body each time.
+        """
+
+        if self._payload is None:
+            self._payload = {
+                "encoding": "base64",
+                "data": self.as_base64(),
+                "shape": list(self.pixels.shape),
+                "dtype": str(self.pixels.dtype),
+                "timestamp": self.timestamp,
+            }
+        return self._payload
 
     def describe(self) -> Dict[str, object]:
         """Return structured metadata for logging and health reports."""
@@ -60,13 +145,7 @@ class GameState:
         """Convert the state into a JSON serialisable payload."""
 
         return {
-            "frame": {
-                "encoding": "base64",
-                "data": self.frame.as_base64(),
-                "shape": list(self.frame.pixels.shape),
-                "dtype": str(self.frame.pixels.dtype),
-                "timestamp": self.frame.timestamp,
-            },
+            "frame": self.frame.to_payload(),
             "is_game_over": self.is_game_over,
             "paused": self.paused,
             "score": self.score,
@@ -120,18 +199,40 @@ class HealthStatus:
         }
 
 
+#: Number of recent frame durations retained for rolling statistics.
+_FRAME_TIME_CAPACITY = 1024
+
+
 @dataclass
 class MetricsAccumulator:
-    """Helper to store runtime metrics for observability endpoints."""
+    """Helper to store runtime metrics for observability endpoints.
+
+    Frame durations land in a preallocated float64 ring buffer instead of an
+    unbounded Python list, and mean/min/max are maintained as running scalars
+    so ``summary()`` is O(1) rather than an O(N) rebox-and-reduce per call.
+    """
 
     total_steps: int = 0
     total_failures: int = 0
     total_recoveries: int = 0
-    frame_times: list[float] = field(default_factory=list)
+    frame_times: np.ndarray = field(
+        default_factory=lambda: np.empty(_FRAME_TIME_CAPACITY, dtype=np.float64),
+        repr=False,
+    )
+    _head: int = field(default=0, init=False, repr=False)
+    _sum: float = field(default=0.0, init=False, repr=False)
+    _min: float = field(default=float("inf"), init=False, repr=False)
+    _max: float = field(default=0.0, init=False, repr=False)
 
     def register_step(self, duration: float) -> None:
         self.total_steps += 1
-        self.frame_times.append(duration)
+        self.frame_times[self._head] = duration
+        self._head = (self._head + 1) % self.frame_times.shape[0]
+        self._sum += duration
+        if duration < self._min:
+            self._min = duration
+        if duration > self._max:
+            self._max = duration
 
     def register_failure(self) -> None:
         self.total_failures += 1
@@ -140,10 +241,10 @@ class MetricsAccumulator:
         self.total_recoveries += 1
 
     def summary(self) -> Dict[str, object]:
-        if self.frame_times:
-            mean_frame_time = float(np.mean(self.frame_times))
-            max_frame_time = float(np.max(self.frame_times))
-            min_frame_time = float(np.min(self.frame_times))
+        if self.total_steps:
+            mean_frame_time = self._sum / self.total_steps
+            max_frame_time = self._max
+            min_frame_time = self._min
         else:
             mean_frame_time = max_frame_time = min_frame_time = 0.0
         return {
@@ -1,16 +1,30 @@
 """Session management coordinating engine, monitoring and persistence."""
 from __future__ import annotations
 
+import hashlib
+import itertools
+import os
 import time
-import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
+
+import numpy as np
+import orjson
 
 from .config import EmulatorConfig
-from .engine import PyBoyEngine
+from .engine import PyBoyEngine, ensure_path
 from .models import GameState, GameStepResult, HealthStatus
 from .monitor import HealthMonitor
 
+# In-process session ids: a per-boot prefix plus a monotonic counter is
+# sortable by creation order and skips the urandom read and 32-char hex
+# formatting of uuid4 on every session start. The random boot component
+# (one urandom read per process, at import) keeps ids — and therefore save
+# state filenames — from colliding across restarts or recycled pids.
+_SESSION_PREFIX = f"{os.getpid():x}-{os.urandom(4).hex()}"
+_session_counter = itertools.count(1)
+
 
 class EmulatorSession:
     """Encapsulates a running PyBoy emulator instance."""
@@ -26,10 +40,17 @@ class EmulatorSession:
         self.config = config
         self.engine = engine
         self.monitor = monitor
-        self.session_id = session_id or uuid.uuid4().hex
+        self.session_id = session_id or f"{_SESSION_PREFIX}-{next(_session_counter):x}"
+        self._action_index = {
+            label: index for index, label in enumerate(engine.action_labels)
+        }
+        self._action_labels_csv = ", ".join(engine.action_labels)
         self._active = False
         self._last_result: Optional[GameStepResult] = None
         self._last_health: Optional[HealthStatus] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._save_executor: Optional[ThreadPoolExecutor] = None
+        self._save_seq = 0
 
     # ------------------------------------------------------------------
     # Lifecycle
@@ -47,6 +68,8 @@ class EmulatorSession:
     def step(self, action_label: str) -> GameStepResult:
         if not self._active:
             raise RuntimeError("The emulator session has not been started yet.")
+        if action_label not in self._action_index:
+            raise ValueError(f"Acción desconocida: {action_label}")
         start = time.perf_counter()
         result = self.engine.step(action_label)
         elapsed = time.perf_counter() - start
@@ -74,7 +97,7 @@ class EmulatorSession:
             result.info.setdefault("health", self._health_payload())
 
         if result.new_state.step_count % self.config.autosave_interval_steps == 0:
-            self.save_state()
+            self._autosave()
 
         self._last_result = result
         return result
@@ -82,10 +105,85 @@ class EmulatorSession:
     def current_state(self) -> GameState:
         return self.engine.capture_state()
 
+    def observe(self) -> Tuple[str, bytes]:
+        """Capture the current state once and derive both AI prompt inputs.
+
+        Returns the JSON observation summary and the frame digest computed
+        from the same snapshot, so the memoization key always matches the
+        frame the prompt describes, for the cost of a single capture. Must
+        run on the session's executor like every other engine call.
+        """
+
+        state = self.engine.capture_state()
+        return self._summarize_state(state), self._digest_state(state)
+
+    def _summarize_state(self, state: GameState) -> str:
+        """Compact JSON summary of *state* for AI prompts.
+
+        ``mean_pixel`` is a telemetry hint, not an exact mean: it is computed
+        over a 4×4-strided sample with an integer accumulator, which streams
+        1/16th of the frame and skips the per-element float64 promotion a
+        full ``.mean()`` would do every AI step.
+        """
+
+        pixels = state.frame.pixels
+        if pixels.size:
+            sample = pixels[::4, ::4]
+            mean_pixel = round(float(sample.sum(dtype=np.uint64)) / sample.size, 3)
+        else:
+            mean_pixel = 0.0
+        summary = {
+            # orjson serialises tuples natively; no per-frame list() copy.
+            "shape": pixels.shape,
+            "mean_pixel": mean_pixel,
+            "score": state.score,
+            "step_count": state.step_count,
+            # Monotonic integer nanoseconds: cheaper to read than wall-clock
+            # time, immune to NTP jumps, and serialises without float repr.
+            "timestamp": time.monotonic_ns(),
+        }
+        return orjson.dumps(summary).decode()
+
+    def _digest_state(self, state: GameState) -> bytes:
+        """Cheap perceptual hash of *state*'s frame, prefixed per session.
+
+        Hashes a 16×16-strided sample (~1/256th of the pixels) so consecutive
+        near-identical frames — title screens, cut-scenes — collapse to the
+        same key for AI-suggestion memoization.
+        """
+
+        digest = hashlib.blake2b(
+            state.frame.pixels[::16, ::16].tobytes(), digest_size=8
+        ).digest()
+        return self.session_id.encode() + digest
+
+    def has_action(self, label: str) -> bool:
+        """Whether *label* is a known action for this session (O(1))."""
+
+        return label in self._action_index
+
     @property
     def action_labels(self) -> tuple[str, ...]:
         return self.engine.action_labels
 
+    @property
+    def action_labels_csv(self) -> str:
+        """Pre-joined label list, cached once for AI prompt building."""
+        return self._action_labels_csv
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Single-thread executor dedicated to this session's blocking work.
+
+        PyBoy is not thread-safe, so every engine call for a session must run
+        on the same worker thread; one executor per session keeps sessions
+        from serialising each other while preserving that invariant.
+        """
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1)
+        return self._executor
+
     def current_health(self) -> dict[str, object]:
         return self._health_payload()
 
@@ -99,12 +197,48 @@ class EmulatorSession:
         return state
 
     def save_state(self) -> Path:
-        filename = f"{self.session_id}-{int(time.time() * 1000)}.state"
+        # A per-session sequence number keeps filenames unique and sortable
+        # even when autosaves land within the same millisecond; timestamps
+        # could collide and silently overwrite the previous save.
+        self._save_seq += 1
+        filename = f"{self.session_id}-{self._save_seq:08d}.state"
         path = self.config.save_states_path / filename
         saved_path = self.engine.save_state(path)
         self.monitor.remember_save_path(saved_path)
         return saved_path
 
+    def _autosave(self) -> None:
+        """Persist the current state without stalling the step path.
+
+        The state blob is captured in memory on the calling (emulator)
+        thread, then the multi-megabyte disk write is handed to a dedicated
+        writer thread. The save path is remembered only once the write has
+        completed so recovery never picks a half-written file. Engines that
+        cannot serialise to memory fall back to the synchronous save.
+        """
+
+        serialize = getattr(self.engine, "serialize_state", None)
+        if serialize is None:
+            self.save_state()
+            return
+        blob = serialize()
+        self._save_seq += 1
+        path = self.config.save_states_path / f"{self.session_id}-{self._save_seq:08d}.state"
+        if self._save_executor is None:
+            self._save_executor = ThreadPoolExecutor(max_workers=1)
+        self._save_executor.submit(self._write_save, path, blob)
+
+    def _write_save(self, path: Path, blob: bytes) -> None:
+        ensure_path(path)
+        with path.open("wb") as handle:
+            handle.write(blob)
+            handle.flush()
+            if hasattr(os, "posix_fadvise"):  # pragma: no branch - Linux hosts
+                # Autosave blobs are cold data; tell the kernel not to keep
+                # them resident at the expense of hot frame buffers.
+                os.posix_fadvise(handle.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+        self.monitor.remember_save_path(path)
+
     def load_state(self, path: Path) -> GameState:
         state = self.engine.load_state(path)
         self.monitor.remember_save_path(path)
@@ -114,6 +248,13 @@ class EmulatorSession:
     def close(self) -> None:
         self.engine.shutdown()
         self._active = False
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        if self._save_executor is not None:
+            # Wait so queued autosave writes land on disk before teardown.
+            self._save_executor.shutdown(wait=True)
+            self._save_executor = None
 
     def _perform_recovery(self) -> GameState:
         recovery_path = self.monitor.last_save_path
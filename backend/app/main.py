@@ -4,12 +4,17 @@ from __future__ import annotations
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from .api.routes import get_manager, router
+from .api.routes import ORJSONResponse, router, shutdown_manager
 from .core.config import get_settings
+from .services.gemma import shutdown_gemma_client
 
 
 settings = get_settings()
-app = FastAPI(title="IAboy Backend", version="0.1.0")
+app = FastAPI(
+    title="IAboy Backend",
+    version="0.1.0",
+    default_response_class=ORJSONResponse,
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -24,5 +29,5 @@ app.include_router(router, prefix=settings.api_prefix)
 
 @app.on_event("shutdown")
 async def on_shutdown() -> None:
-    manager = get_manager()
-    manager.shutdown()
+    shutdown_manager()
+    await shutdown_gemma_client()
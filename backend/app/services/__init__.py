@@ -0,0 +1,17 @@
+"""Service clients used by the API layer."""
+
+from .gemma import (
+    GemmaClient,
+    build_action_prompt,
+    get_gemma_client,
+    shutdown_gemma_client,
+    shutdown_shared_client,
+)
+
+__all__ = [
+    "GemmaClient",
+    "build_action_prompt",
+    "get_gemma_client",
+    "shutdown_gemma_client",
+    "shutdown_shared_client",
+]
@@ -0,0 +1,245 @@
+"""Async client for the Gemma 2 model served by a local Ollama instance."""
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from typing import AsyncIterator, Dict, List, Optional, Union
+
+import httpx
+import orjson
+
+from ..core.config import get_settings
+from ..models.messages import ChatMessage
+
+# Static prompt head shared by every AI-driven step. Kept as a module constant
+# so per-step prompt building is a single f-string interpolation.
+#: Upper bound on memoized action suggestions (see GemmaClient.generate_action).
+_ACTION_CACHE_SIZE = 256
+
+_ACTION_PROMPT = (
+    "Eres Gemma 2 y controlas un Game Boy. Responde únicamente con la etiqueta "
+    "de la acción a ejecutar, sin texto adicional."
+)
+
+
+def build_action_prompt(
+    observation_summary: str,
+    action_labels_csv: str,
+    player_action: Optional[str] = None,
+) -> str:
+    """Compose the prompt asking Gemma 2 for the next emulator action.
+
+    ``action_labels_csv`` is expected to be the per-session pre-joined label
+    string so no per-step join is needed.
+    """
+
+    prompt = (
+        f"{_ACTION_PROMPT}\n"
+        f"Observación: {observation_summary}\n"
+        f"Acciones disponibles: {action_labels_csv}"
+    )
+    if player_action:
+        prompt += f"\nEl humano sugiere: {player_action}"
+    return prompt
+
+
+_shared_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_shared_client() -> httpx.AsyncClient:
+    """Return the process-wide ``httpx.AsyncClient``, creating it on demand.
+
+    Construction involves no ``await``, so on a single event loop the
+    check-and-assign below cannot interleave and needs no lock. Explicit
+    pool limits plus HTTP/2: keep-alive avoids re-running the TCP handshake
+    per call and HTTP/2 multiplexes concurrent chat and action requests over
+    one connection to Ollama.
+    """
+
+    global _shared_client
+    if _shared_client is None:
+        settings = get_settings()
+        _shared_client = httpx.AsyncClient(
+            base_url=settings.ollama_url,
+            timeout=httpx.Timeout(120.0, connect=5.0),
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=30.0,
+            ),
+        )
+    return _shared_client
+
+
+async def shutdown_shared_client() -> None:
+    """Close the process-wide connection pool (app shutdown hook)."""
+
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
+
+
+class GemmaClient:
+    """Thin wrapper around the Ollama HTTP API.
+
+    Every instance routes its calls through the process-wide connection
+    pool, so TCP connections to Ollama are kept alive and reused no matter
+    how many clients are constructed. Tests can still inject their own
+    ``httpx.AsyncClient``.
+    """
+
+    def __init__(self, http: Optional[httpx.AsyncClient] = None) -> None:
+        settings = get_settings()
+        self.model = settings.ollama_model
+        self._parallel = settings.ollama_parallel
+        self._http = http
+        # Created lazily inside a running loop; Python 3.8 primitives bind
+        # their event loop at construction time.
+        self._sem: Optional[asyncio.Semaphore] = None
+        self._inflight: Dict[Union[str, bytes], "asyncio.Future[str]"] = {}
+        self._action_cache: "OrderedDict[bytes, str]" = OrderedDict()
+
+    @property
+    def _client(self) -> httpx.AsyncClient:
+        return self._http if self._http is not None else _get_shared_client()
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        if self._sem is None:
+            self._sem = asyncio.Semaphore(self._parallel)
+        return self._sem
+
+    async def stream_chat_reply(self, messages: List[ChatMessage]) -> AsyncIterator[str]:
+        """Yield the Ollama reply incrementally, token group by token group.
+
+        Streaming turns the caller's wait into time-to-first-token instead of
+        total generation time and avoids buffering the full reply body. Each
+        NDJSON line is decoded individually as it arrives.
+        """
+
+        # Serialize the whole body in one orjson pass; ChatMessage only holds
+        # plain str fields, so reading __dict__ avoids a per-message .dict()
+        # walk through Pydantic before the JSON encode.
+        body = orjson.dumps(
+            {
+                "model": self.model,
+                "messages": [message.__dict__ for message in messages],
+                "stream": True,
+            }
+        )
+        async with self._semaphore():
+            async with self._client.stream(
+                "POST",
+                "/api/chat",
+                content=body,
+                headers={"Content-Type": "application/json"},
+            ) as response:
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    if not line:
+                        continue
+                    chunk = orjson.loads(line)
+                    content = chunk.get("message", {}).get("content", "")
+                    if content:
+                        yield content
+
+    async def stream_chat_reply_bytes(
+        self, messages: List[ChatMessage]
+    ) -> AsyncIterator[bytes]:
+        """Yield reply chunks as UTF-8 bytes, ready for ``ws.send_bytes``.
+
+        Consumers forwarding the stream to a binary transport get chunks they
+        can pass through untouched; each chunk is a few tokens, so the single
+        encode here is the only string handling on the path.
+        """
+
+        async for part in self.stream_chat_reply(messages):
+            yield part.encode("utf-8")
+
+    async def generate_chat_reply(self, messages: List[ChatMessage]) -> str:
+        """Send the conversation history to Ollama and return the full reply."""
+
+        parts = [part async for part in self.stream_chat_reply(messages)]
+        return "".join(parts)
+
+    async def generate_action(
+        self, prompt: str, cache_key: Optional[bytes] = None
+    ) -> str:
+        """Ask Gemma 2 for an action label given an observation prompt.
+
+        Concurrency is bounded by ``ollama_parallel`` so bursts of AI steps
+        overlap their RTTs without overflowing Ollama's request queue, and
+        identical prompts issued while a request is already in flight attach
+        to that request instead of queueing a duplicate generation.
+
+        When callers pass a ``cache_key`` — a cheap hash of the frame the
+        prompt describes — near-identical frames (title screens, cut-scenes)
+        reuse the previous suggestion and skip the Ollama round-trip
+        entirely. The cache is LRU-bounded at ``_ACTION_CACHE_SIZE``.
+        """
+
+        if cache_key is not None:
+            cached = self._action_cache.get(cache_key)
+            if cached is not None:
+                self._action_cache.move_to_end(cache_key)
+                return cached
+        # Coalesce by frame key when one is given: prompts embed a per-step
+        # timestamp so their text never repeats, but concurrent requests for
+        # the same frame should share one upstream generation.
+        inflight_key = prompt if cache_key is None else cache_key
+        task = self._inflight.get(inflight_key)
+        if task is None:
+            task = asyncio.ensure_future(self._request_action(prompt))
+            self._inflight[inflight_key] = task
+            task.add_done_callback(
+                lambda _task, key=inflight_key: self._inflight.pop(key, None)
+            )
+        action = await task
+        if cache_key is not None:
+            self._action_cache[cache_key] = action
+            if len(self._action_cache) > _ACTION_CACHE_SIZE:
+                self._action_cache.popitem(last=False)
+        return action
+
+    async def _request_action(self, prompt: str) -> str:
+        body = orjson.dumps({"model": self.model, "prompt": prompt, "stream": False})
+        async with self._semaphore():
+            response = await self._client.post(
+                "/api/generate", content=body, headers={"Content-Type": "application/json"}
+            )
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+        return data.get("response", "").strip()
+
+    async def close(self) -> None:
+        """Close an injected per-instance client; the shared pool stays open.
+
+        The process-wide pool is torn down once, via
+        :func:`shutdown_shared_client`, not by individual instances.
+        """
+
+        if self._http is not None:
+            await self._http.aclose()
+
+
+_gemma_client: Optional[GemmaClient] = None
+
+
+def get_gemma_client() -> GemmaClient:
+    """Return the process-wide :class:`GemmaClient`, creating it on first use."""
+
+    global _gemma_client
+    if _gemma_client is None:
+        _gemma_client = GemmaClient()
+    return _gemma_client
+
+
+async def shutdown_gemma_client() -> None:
+    """Drop the shared client and close the underlying connection pool."""
+
+    global _gemma_client
+    if _gemma_client is not None:
+        await _gemma_client.close()
+        _gemma_client = None
+    await shutdown_shared_client()
@@ -21,6 +21,9 @@ class FakeEngine:
         self._step_count = 0
         self._last_state: GameState | None = None
         self._saved_states: dict[Path, GameState] = {}
+        # Reused across steps; tests only inspect frames, never mutate them,
+        # so one fill-per-step buffer avoids a fresh ~70 KB np.full each call.
+        self._frame_buf = np.empty((144, 160, 3), dtype=np.uint8)
 
     @property
     def action_labels(self) -> tuple[str, ...]:
@@ -80,7 +83,8 @@ class FakeEngine:
         if broken:
             pixels = np.empty((0,), dtype=np.uint8)
         else:
-            pixels = np.full((144, 160, 3), value, dtype=np.uint8)
+            self._frame_buf.fill(value)
+            pixels = self._frame_buf
         frame = FrameEnvelope(pixels=pixels)
         return GameState(
             frame=frame,
@@ -0,0 +1,86 @@
+import asyncio
+
+from app.services.gemma import (
+    GemmaClient,
+    _get_shared_client,
+    shutdown_shared_client,
+)
+
+
+def test_gemma_clients_share_one_connection_pool():
+    try:
+        first = GemmaClient()
+        second = GemmaClient()
+        assert first._client is second._client
+        assert first._client is _get_shared_client()
+    finally:
+        asyncio.run(shutdown_shared_client())
+
+
+class FakeOllamaHttp:
+    """Counts /api/generate posts and returns a canned action reply."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def post(self, *args, **kwargs):
+        self.calls += 1
+        # Yield once so concurrent callers can attach to the in-flight task.
+        await asyncio.sleep(0)
+
+        class FakeResponse:
+            content = b'{"response": "UP"}'
+
+            def raise_for_status(self):
+                return None
+
+        return FakeResponse()
+
+
+def test_concurrent_same_frame_actions_share_one_request():
+    fake = FakeOllamaHttp()
+    client = GemmaClient(http=fake)
+
+    async def run():
+        # Prompts differ (they embed per-step timestamps) but the frame
+        # digest is identical, so all three must coalesce upstream.
+        return await asyncio.gather(
+            *[
+                client.generate_action(f"prompt-{i}", cache_key=b"frame")
+                for i in range(3)
+            ]
+        )
+
+    assert asyncio.run(run()) == ["UP", "UP", "UP"]
+    assert fake.calls == 1
+
+    # A later call for the same frame is served from the LRU cache.
+    assert asyncio.run(client.generate_action("prompt-later", cache_key=b"frame")) == "UP"
+    assert fake.calls == 1
+
+
+def test_stream_chat_reply_bytes_encodes_each_chunk():
+    client = GemmaClient(http=FakeOllamaHttp())
+
+    async def fake_stream(messages):
+        for part in ("hola", " mundo"):
+            yield part
+
+    client.stream_chat_reply = fake_stream
+
+    async def collect():
+        return [chunk async for chunk in client.stream_chat_reply_bytes([])]
+
+    assert asyncio.run(collect()) == [b"hola", b" mundo"]
+
+
+def test_injected_client_bypasses_shared_pool():
+    class FakeHttp:
+        async def aclose(self):
+            self.closed = True
+
+    fake = FakeHttp()
+    client = GemmaClient(http=fake)
+    assert client._client is fake
+    asyncio.run(client.close())
+    assert fake.closed